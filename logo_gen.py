@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
+import functools
 import requests
 import datetime
 import os
 import subprocess
 import time
+import zoneinfo
 
 # --- Configuration ---
 # Set the date for the schedule. Defaults to today's date.
@@ -24,35 +26,78 @@ BASE_OUTPUT_DIR = "game_graphics"
 IMAGE_SIZE = "500x500" # Target final image size
 LOGO_SIZE = "200x200" # Size to which the downloaded logos will be resized
 
+# Display timezone: DST-aware, unlike a fixed UTC-6 offset
+CENTRAL_TZ = zoneinfo.ZoneInfo("America/Chicago")
+
+# Minimum spacing between schedule API requests. The logo CDN is not
+# throttled; only site.api.espn.com needs politeness.
+SCHEDULE_MIN_INTERVAL = 0.2
+_last_schedule_request = 0.0
+
 # --- Helper Functions (No Change) ---
 
+# Parsed team info, memoized by team uid: the same team dict recurs across
+# events (a team plays many games), so parse it once per session. Keyed by
+# the globally-unique uid (e.g. 's:40~l:46~t:1') -- the plain numeric id is
+# only unique within a league and collides across the four leagues.
+_TEAM_INFO_CACHE = {}
+
 def get_team_info(team_data):
     """Extracts required information (name, colors, logo URL) for a team."""
+    team_uid = team_data.get('uid')
+    if team_uid is not None and team_uid in _TEAM_INFO_CACHE:
+        return _TEAM_INFO_CACHE[team_uid]
+
     abbrev = team_data.get('abbreviation', 'TBD')
-    # Remove the initial '#' from color codes if they exist (sometimes the API provides them, sometimes not)
-    color = "#" + team_data.get('color', 'CCCCCC').lstrip('#')  # Default to gray if color missing
-    alt_color = "#" + team_data.get('altColor', '000000').lstrip('#') # Secondary color for border/text
+    # Normalize the optional leading '#' on color codes (sometimes the API provides it, sometimes not)
+    color = "#" + team_data.get('color', 'CCCCCC').removeprefix('#')  # Default to gray if color missing
+    alt_color = "#" + team_data.get('altColor', '000000').removeprefix('#') # Secondary color for border/text
 
     logo_url = None
     logos = team_data.get('logos')
-    
-    # 1. Check the preferred 'logos' list structure
-    if logos and len(logos) > 0:
-        # Prioritize the logo marked as 'default' if possible, otherwise take the first one.
-        default_logo = next((logo for logo in logos if 'default' in logo.get('rel', [])), None)
-        logo_to_use = default_logo if default_logo else logos[0]
+
+    # 1. Check the preferred 'logos' list structure.
+    # Prioritize the logo marked as 'default' if possible, otherwise take the first one.
+    if logos:
+        logo_to_use = logos[0]
+        for logo in logos:
+            if 'default' in logo.get('rel', []):
+                logo_to_use = logo
+                break
         logo_url = logo_to_use.get('href')
 
     # 2. Add fallback check for a simple 'logo' key which sometimes holds the URL string
     if not logo_url:
         logo_url = team_data.get('logo') # Check for single logo URL string
 
-    return {
+    info = {
         'abbrev': abbrev,
         'color': color,
         'alt_color': alt_color,
         'logo_url': logo_url
     }
+    if team_uid is not None:
+        _TEAM_INFO_CACHE[team_uid] = info
+    return info
+
+@functools.lru_cache(maxsize=64)
+def format_game_time(raw_time_str):
+    """
+    Formats an ISO UTC timestamp (e.g. 2025-11-12T00:00Z) as a Central Time
+    display string. fromisoformat is C-implemented (much faster than the
+    regex-backed strptime) and zoneinfo handles DST correctly. Memoized
+    because many games share a tip-off time.
+    """
+    try:
+        dt_utc = datetime.datetime.fromisoformat(raw_time_str.replace('Z', '+00:00'))
+        game_time_str = dt_utc.astimezone(CENTRAL_TZ).strftime('%I:%M %p CT')
+        # Remove leading zero for cleaner time display (e.g., '07:30 PM' -> '7:30 PM')
+        if game_time_str.startswith('0'):
+            game_time_str = game_time_str[1:]
+        return game_time_str
+    except Exception as e:
+        print(f"  > Warning: Could not parse time string '{raw_time_str}'. Error: {e}")
+        return "TIME TBD"
 
 def download_file(url, local_path):
     """Downloads a file from a URL to a local path."""
@@ -99,20 +144,7 @@ def generate_image(away_team, home_team, raw_time_str, league_name, output_dir):
         return False
 
     # 2. Time Formatting
-    try:
-        # Assuming ISO format like 2025-11-12T00:00Z. Parse as UTC.
-        dt_utc = datetime.datetime.strptime(raw_time_str, '%Y-%m-%dT%H:%MZ').replace(tzinfo=datetime.timezone.utc)
-        
-        # Adjusting to Central Time (CT). UTC-6 offset.
-        # This assumes no daylight savings time adjustment, which is acceptable for a daily sports schedule.
-        dt_local = dt_utc - datetime.timedelta(hours=6) 
-        game_time_str = dt_local.strftime('%I:%M %p CT')
-        # Remove leading zero for cleaner time display (e.g., '07:30 PM' -> '7:30 PM')
-        if game_time_str.startswith('0'):
-            game_time_str = game_time_str[1:]
-    except Exception as e:
-        print(f"  > Warning: Could not parse time string '{raw_time_str}'. Error: {e}")
-        game_time_str = "TIME TBD"
+    game_time_str = format_game_time(raw_time_str)
 
     # 3. ImageMagick Command Construction (Diagonal Split and White Line)
 
@@ -165,17 +197,19 @@ def generate_image(away_team, home_team, raw_time_str, league_name, output_dir):
     try:
         # Check if the desired font (Noto-Sans-Light) is available; if not, fall back to a generic sans-serif
         font_check_command = ['identify', '-list', 'font', 'Noto-Sans-Light']
-        result = subprocess.run(font_check_command, capture_output=True, text=True)
+        result = subprocess.run(font_check_command, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
         if result.returncode != 0:
              # Fallback to a common, less bold sans-serif
             command[13] = 'sans-serif' 
         
-        subprocess.run(command, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE)
         print(f"  > SUCCESS: Graphic saved to {output_file}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"  > ERROR: ImageMagick command failed for {game_id}.")
-        print(f"  > Stderr: {e.stderr}")
+        print(f"  > Stderr: {e.stderr.decode(errors='replace')}")
         return False
     finally:
         # Clean up temporary logo files
@@ -185,10 +219,21 @@ def generate_image(away_team, home_team, raw_time_str, league_name, output_dir):
         except OSError as e:
             print(f"  > Warning: Could not remove temporary file(s). {e}")
 
+def _rate_limit_schedule():
+    """Keeps at least SCHEDULE_MIN_INTERVAL between schedule API requests.
+    Replaces the old blanket time.sleep(0.5) after every game, which idled
+    the whole run to guard an API that is only called once per league."""
+    global _last_schedule_request
+    wait = _last_schedule_request + SCHEDULE_MIN_INTERVAL - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+    _last_schedule_request = time.monotonic()
+
 def fetch_schedule(sport, league):
     """Fetches the daily scoreboard data for a specific sport/league."""
     api_url = f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/scoreboard?dates={TARGET_DATE}"
     print(f"Fetching schedule for {league.upper()} on {TARGET_DATE} from: {api_url}")
+    _rate_limit_schedule()
     try:
         response = requests.get(api_url, timeout=10)
         response.raise_for_status()
@@ -203,11 +248,8 @@ def process_league(config):
     LEAGUE = config['league']
     LEAGUE_NAME = config['name']
     
-    # Create league-specific output directory
+    # Output directories are pre-created in main()
     output_dir = os.path.join(BASE_OUTPUT_DIR, LEAGUE)
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"Created output directory: {output_dir}")
 
     data = fetch_schedule(SPORT, LEAGUE)
     
@@ -249,9 +291,7 @@ def process_league(config):
             
         if generate_image(away_team, home_team, raw_time_str, LEAGUE_NAME.lower(), output_dir):
             processed_count += 1
-            
-        time.sleep(0.5) # Be kind to the API endpoints
-        
+
     print(f"\n--- {LEAGUE_NAME} Processing Finished ---")
     print(f"Successfully created {processed_count} {LEAGUE_NAME} graphic(s).")
     return processed_count
@@ -261,10 +301,10 @@ def process_league(config):
 def main():
     """Main function to run the process for all configured leagues."""
     
-    # Ensure the base output directory exists
-    if not os.path.exists(BASE_OUTPUT_DIR):
-        os.makedirs(BASE_OUTPUT_DIR)
-        print(f"Created base output directory: {BASE_OUTPUT_DIR}")
+    # Create every output directory upfront. exist_ok avoids the racy
+    # exists-then-create pattern and costs a single syscall per directory.
+    for config in LEAGUE_CONFIGS:
+        os.makedirs(os.path.join(BASE_OUTPUT_DIR, config['league']), exist_ok=True)
 
     total_processed = 0
     
@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
+import concurrent.futures
+import functools
 import requests
 import datetime
 import os
+import queue
+import select
+import shlex
+import shutil
 import subprocess
+import tempfile
+import threading
 import time
 import sys # Import sys to handle command line arguments
+import zoneinfo
 
 # --- Configuration ---
 # Set the date for the schedule. 
@@ -37,32 +46,75 @@ def get_output_dir():
 IMAGE_SIZE = "500x500" # Target final image size
 LOGO_SIZE = "200x200" # Size to which the downloaded logos will be resized
 
+# Display timezone: DST-aware, unlike a fixed UTC-6 offset
+CENTRAL_TZ = zoneinfo.ZoneInfo("America/Chicago")
+
+# Minimum spacing between schedule API requests. The logo CDN is not
+# throttled; only site.api.espn.com needs politeness.
+SCHEDULE_MIN_INTERVAL = 0.2
+_last_schedule_request = 0.0
+
 # --- Helper Functions ---
 
+# Parsed team info, memoized by team uid: the same team dict recurs across
+# events (a team plays many games), so parse it once per session. Keyed by
+# the globally-unique uid (e.g. 's:40~l:46~t:1') -- the plain numeric id is
+# only unique within a league and collides across the four leagues.
+_TEAM_INFO_CACHE = {}
+
 def get_team_info(team_data):
     """Extracts required information (name, colors, logo URL) for a team."""
+    team_uid = team_data.get('uid')
+    if team_uid is not None and team_uid in _TEAM_INFO_CACHE:
+        return _TEAM_INFO_CACHE[team_uid]
+
     abbrev = team_data.get('abbreviation', 'TBD')
-    # Use lstrip('#') to ensure color codes are clean
-    color = "#" + team_data.get('color', 'CCCCCC').lstrip('#') 
-    alt_color = "#" + team_data.get('altColor', '000000').lstrip('#')
+    # Normalize the optional leading '#' on color codes
+    color = "#" + team_data.get('color', 'CCCCCC').removeprefix('#')
+    alt_color = "#" + team_data.get('altColor', '000000').removeprefix('#')
 
     logo_url = None
     logos = team_data.get('logos')
-    
-    if logos and len(logos) > 0:
-        default_logo = next((logo for logo in logos if 'default' in logo.get('rel', [])), None)
-        logo_to_use = default_logo if default_logo else logos[0]
+
+    # Favor the logo marked 'default', otherwise take the first one
+    if logos:
+        logo_to_use = logos[0]
+        for logo in logos:
+            if 'default' in logo.get('rel', []):
+                logo_to_use = logo
+                break
         logo_url = logo_to_use.get('href')
 
     if not logo_url:
         logo_url = team_data.get('logo')
 
-    return {
+    info = {
         'abbrev': abbrev,
         'color': color,
         'alt_color': alt_color,
         'logo_url': logo_url
     }
+    if team_uid is not None:
+        _TEAM_INFO_CACHE[team_uid] = info
+    return info
+
+@functools.lru_cache(maxsize=64)
+def format_game_time(raw_time_str):
+    """
+    Formats an ISO UTC timestamp (e.g. 2025-11-12T00:00Z) as a Central Time
+    display string. fromisoformat is C-implemented (much faster than the
+    regex-backed strptime) and zoneinfo handles DST correctly. Memoized
+    because many games share a tip-off time.
+    """
+    try:
+        dt_utc = datetime.datetime.fromisoformat(raw_time_str.replace('Z', '+00:00'))
+        game_time_str = dt_utc.astimezone(CENTRAL_TZ).strftime('%I:%M %p CT')
+        if game_time_str.startswith('0'):
+            game_time_str = game_time_str[1:]
+        return game_time_str
+    except Exception as e:
+        print(f"  > Warning: Could not parse time string '{raw_time_str}'. Error: {e}")
+        return "TIME TBD"
 
 def download_file(url, local_path):
     """Downloads a file from a URL to a local path."""
@@ -79,129 +131,284 @@ def download_file(url, local_path):
 
 # --- Core Logic Functions (Modified) ---
 
+@functools.lru_cache(maxsize=1)
 def get_magick_executable():
-    """Determines if 'convert' or 'magick' is the correct ImageMagick command (Ubuntu should use 'convert')."""
-    try:
-        subprocess.run(['convert', '-version'], check=True, capture_output=True, text=True)
+    """
+    Determines if 'convert' or 'magick' is the correct ImageMagick command
+    (Ubuntu should use 'convert'). The probe is a constant, so it is cached
+    for the whole run instead of being re-discovered per invocation, and a
+    plain PATH lookup is tried before spawning any probe process.
+    """
+    if shutil.which('convert'):
         return 'convert'
+    if shutil.which('magick'):
+        return 'magick'
+    # Nothing on PATH; probe directly in case `which` missed an alias/shim
+    try:
+        subprocess.run(['magick', '-version'], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return 'magick'
     except (subprocess.CalledProcessError, FileNotFoundError):
+        return 'convert' # Default fallback
+
+# Pool of long-lived `magick -script -` workers. Feeding successive
+# operations over stdin amortizes ImageMagick's process startup and library
+# load across the whole run, and N workers let N games render concurrently.
+MAGICK_WORKERS = min(4, os.cpu_count() or 1)
+# Keep each worker single-threaded so N of them don't oversubscribe cores
+_MAGICK_ENV = {**os.environ, 'MAGICK_THREAD_LIMIT': '1', 'OMP_THREAD_LIMIT': '1'}
+
+_idle_workers = queue.Queue()
+_all_workers = []
+_workers_lock = threading.Lock()
+_magick_unavailable = False
+# Consecutive script-protocol failures across all render threads. Once every
+# worker slot has struck out, the pool is disabled for the rest of the run so
+# each operation costs one one-shot process instead of a doomed spawn first.
+_script_failures = 0
+_SCRIPT_FAILURE_LIMIT = MAGICK_WORKERS
+
+# Per-game scratch space for intermediate logo files. Prefer the tmpfs at
+# /dev/shm so temps live in RAM and never hit the output disk.
+_SCRATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+def _checkout_worker():
+    """Returns an idle batch-mode magick worker, spawning new ones up to
+    MAGICK_WORKERS. Returns None when IM7's `magick` binary is unavailable."""
+    global _magick_unavailable
+    if _magick_unavailable:
+        return None
+    try:
+        return _idle_workers.get_nowait()
+    except queue.Empty:
+        pass
+    with _workers_lock:
+        if len(_all_workers) < MAGICK_WORKERS:
+            try:
+                proc = subprocess.Popen(
+                    ['magick', '-script', '-'],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE, text=True, env=_MAGICK_ENV)
+                _all_workers.append(proc)
+                return proc
+            except (FileNotFoundError, OSError):
+                _magick_unavailable = True
+                return None
+    # All workers exist and are busy; wait for one to come back
+    try:
+        return _idle_workers.get(timeout=30)
+    except queue.Empty:
+        return None
+
+def _retire_worker(proc):
+    """Removes a dead or misbehaving worker from the pool and surfaces
+    anything it wrote to stderr, so protocol failures are not silent."""
+    with _workers_lock:
+        if proc in _all_workers:
+            _all_workers.remove(proc)
+    try:
+        proc.kill()
+        proc.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    try:
+        err = proc.stderr.read()
+        if err and err.strip():
+            print(f"  > magick worker stderr: {err.strip()}")
+    except (OSError, ValueError):
+        pass
+
+def stop_magick_script():
+    """Shuts down all batch-mode magick workers, if any were started."""
+    with _workers_lock:
+        workers = _all_workers[:]
+        del _all_workers[:]
+    while True:
+        try:
+            _idle_workers.get_nowait()
+        except queue.Empty:
+            break
+    for proc in workers:
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+# How long to wait for a worker's sentinel before declaring it stuck
+SCRIPT_REPLY_TIMEOUT = 20
+
+def _await_sentinel(proc, timeout=SCRIPT_REPLY_TIMEOUT):
+    """
+    Waits for the worker to print its OK sentinel. Reads the raw stdout fd
+    under select() so a worker that dies, stalls, or never flushes its pipe
+    cannot block a render thread forever. Returns True when the sentinel
+    arrives intact within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    fd = proc.stdout.fileno()
+    buf = b''
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return False
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            return False # EOF: the worker is gone
+        buf += chunk
+        if b'OK\n' in buf:
+            return True
+
+def run_magick(args):
+    """
+    Runs one ImageMagick operation. `args` is a convert-style argument list
+    whose image inputs are each preceded by '-read' (script mode has no
+    implicit reads) and whose final element is the output file. Prefers a
+    long-lived script worker from the pool (checked out for the duration of
+    the operation); falls back to a one-shot subprocess — with the '-read'
+    markers stripped — if no worker is available or the worker misbehaves.
+    Raises CalledProcessError on failure, like subprocess.run(check=True).
+    Thread-safe.
+    """
+    global _magick_unavailable, _script_failures
+    proc = _checkout_worker()
+    if proc is not None:
+        # Script mode has no implicit output file either: make the write
+        # explicit, print a sentinel so we know the operation finished
+        # (quoted, so the script tokenizer keeps the \n escape for -print
+        # to expand), then clear the image stack for the next operation.
+        line = ' '.join(shlex.quote(arg) for arg in args[:-1])
+        line += f' -write {shlex.quote(args[-1])} -print "OK\\n" -delete 0--1\n'
+        ok = False
         try:
-            subprocess.run(['magick', '-version'], check=True, capture_output=True, text=True)
-            return 'magick'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return 'convert' # Default fallback
+            proc.stdin.write(line)
+            proc.stdin.flush()
+            ok = _await_sentinel(proc)
+        except (BrokenPipeError, OSError):
+            pass
+        if ok:
+            with _workers_lock:
+                _script_failures = 0
+            _idle_workers.put(proc)
+            return
+        # The worker died, choked, or stalled: retire it (dumping its
+        # stderr) and retry the operation as a one-shot command, which
+        # reports errors properly.
+        _retire_worker(proc)
+        with _workers_lock:
+            _script_failures += 1
+            if (_script_failures >= _SCRIPT_FAILURE_LIMIT
+                    and not _magick_unavailable):
+                _magick_unavailable = True
+                print("  > magick script workers keep failing; "
+                      "using one-shot processes for the rest of the run.")
+
+    one_shot = [arg for arg in args if arg != '-read']
+    subprocess.run([get_magick_executable()] + one_shot,
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
 def generate_image(away_team, home_team, raw_time_str, league_name, output_dir):
     """
     Generates the final game graphic using ImageMagick.
     """
-    magick_cmd = get_magick_executable()
-    
     game_id = f"{away_team['abbrev']}_vs_{home_team['abbrev']}"
     output_file = os.path.join(output_dir, f"{league_name}_{game_id}.png")
-    
-    # Paths for temporary downloaded logos
-    away_logo_dl_path = os.path.join(output_dir, f"temp_{away_team['abbrev']}_dl.png")
-    home_logo_dl_path = os.path.join(output_dir, f"temp_{home_team['abbrev']}_dl.png")
-    # Resized paths
-    away_logo_resized_path = os.path.join(output_dir, f"temp_{away_team['abbrev']}_resized.png")
-    home_logo_resized_path = os.path.join(output_dir, f"temp_{home_team['abbrev']}_resized.png")
 
     print(f"\nProcessing Game: {league_name}: {away_team['abbrev']} @ {home_team['abbrev']}")
-    
-    # 1. Download Logos
-    if away_team['logo_url'] and home_team['logo_url']:
-        print(f"  > Downloading logos...")
-        if not download_file(away_team['logo_url'], away_logo_dl_path):
-            print(f"  > Skipping game {game_id} due to away logo download failure.")
-            return False 
-        if not download_file(home_team['logo_url'], home_logo_dl_path):
-            print(f"  > Skipping game {game_id} due to home logo download failure.")
-            try: os.remove(away_logo_dl_path)
-            except OSError: pass
+
+    # All intermediate logo files live in a per-game scratch directory that
+    # is removed automatically on every exit path. The unique directory name
+    # also keeps concurrent games (same team in a doubleheader) from
+    # clobbering each other's temps.
+    with tempfile.TemporaryDirectory(prefix=f'logo_{game_id}_', dir=_SCRATCH_DIR) as scratch:
+        away_logo_dl_path = os.path.join(scratch, 'away_dl.png')
+        home_logo_dl_path = os.path.join(scratch, 'home_dl.png')
+        away_logo_resized_path = os.path.join(scratch, 'away_resized.png')
+        home_logo_resized_path = os.path.join(scratch, 'home_resized.png')
+
+        # 1. Download Logos
+        if away_team['logo_url'] and home_team['logo_url']:
+            print(f"  > Downloading logos...")
+            if not download_file(away_team['logo_url'], away_logo_dl_path):
+                print(f"  > Skipping game {game_id} due to away logo download failure.")
+                return False
+            if not download_file(home_team['logo_url'], home_logo_dl_path):
+                print(f"  > Skipping game {game_id} due to home logo download failure.")
+                return False
+        else:
+            print(f"  > Skipping game: Logo URL(s) missing.")
             return False
-    else:
-        print(f"  > Skipping game: Logo URL(s) missing.")
-        return False
 
-    # 1.5. Resize Logos and Save
-    print("  > Resizing logos...")
-    try:
-        # Use list for Ubuntu stability, quoting for safety, but rely on clean paths
-        subprocess.run([magick_cmd, away_logo_dl_path, '-resize', LOGO_SIZE, away_logo_resized_path], 
-                       check=True, capture_output=True, text=True)
-        
-        subprocess.run([magick_cmd, home_logo_dl_path, '-resize', LOGO_SIZE, home_logo_resized_path], 
-                       check=True, capture_output=True, text=True)
-        
-    except subprocess.CalledProcessError as e:
-        print(f"  > ERROR: Logo resizing failed. Stderr: {e.stderr}")
-        return False
-    
-    # 2. Time Formatting (Central Time Zone offset)
-    try:
-        dt_utc = datetime.datetime.strptime(raw_time_str, '%Y-%m-%dT%H:%MZ').replace(tzinfo=datetime.timezone.utc)
-        dt_local = dt_utc - datetime.timedelta(hours=6) # UTC-6 for Central Time (CT)
-        game_time_str = dt_local.strftime('%I:%M %p CT')
-        if game_time_str.startswith('0'):
-            game_time_str = game_time_str[1:]
-    except Exception as e:
-        print(f"  > Warning: Could not parse time string '{raw_time_str}'. Error: {e}")
-        game_time_str = "TIME TBD"
-
-    # 3. ImageMagick Command Construction (Diagonal Split, White Line, Logos, Text)
-    command = [
-        magick_cmd, 
-        '-size', IMAGE_SIZE, 
-        f'xc:{away_team["color"]}', 
-        
-        '-fill', home_team['color'],
-        '-draw', 'polygon 0,500 500,0 500,500', 
-        
-        '-strokewidth', '4',
-        '-stroke', 'white',
-        '-fill', 'none',
-        '-draw', 'line 5,495 495,5',
-        
-        away_logo_resized_path,
-        '-geometry', '+25+90', '-composite', 
-        
-        home_logo_resized_path,
-        '-geometry', '+275+210', '-composite',
-        
-        '-pointsize', '48',
-        '-font', 'Noto-Sans-Light',
-        '-fill', 'white', 
-        '-gravity', 'North',
-        '-annotate', '+0+20', game_time_str, 
-        
-        output_file
-    ]
-
-    print(f"  > Generating graphic: {output_file}")
-    
-    try:
-        subprocess.run(command, check=True, capture_output=True, text=True)
-        print(f"  > SUCCESS: Graphic saved to {output_file}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"  > ERROR: ImageMagick command failed for {game_id}.")
-        print(f"  > Stderr: {e.stderr}")
-        return False
-    finally:
-        # Clean up temporary logo files
-        temp_files = [away_logo_dl_path, home_logo_dl_path, away_logo_resized_path, home_logo_resized_path]
-        for f in temp_files:
-            try:
-                os.remove(f)
-            except OSError: 
-                pass
+        # 1.5. Resize Logos and Save
+        print("  > Resizing logos...")
+        try:
+            run_magick(['-read', away_logo_dl_path, '-resize', LOGO_SIZE, away_logo_resized_path])
+            run_magick(['-read', home_logo_dl_path, '-resize', LOGO_SIZE, home_logo_resized_path])
+        except subprocess.CalledProcessError as e:
+            print(f"  > ERROR: Logo resizing failed. Stderr: {e.stderr.decode(errors='replace')}")
+            return False
+
+        # 2. Time Formatting (Central Time, DST-aware)
+        game_time_str = format_game_time(raw_time_str)
+
+        # 3. ImageMagick Command Construction (Diagonal Split, White Line, Logos, Text)
+        command = [
+            '-size', IMAGE_SIZE,
+            '-read', f'xc:{away_team["color"]}',
+
+            '-fill', home_team['color'],
+            '-draw', 'polygon 0,500 500,0 500,500',
+
+            '-strokewidth', '4',
+            '-stroke', 'white',
+            '-fill', 'none',
+            '-draw', 'line 5,495 495,5',
+
+            '-read', away_logo_resized_path,
+            '-geometry', '+25+90', '-composite',
+
+            '-read', home_logo_resized_path,
+            '-geometry', '+275+210', '-composite',
+
+            '-pointsize', '48',
+            '-font', 'Noto-Sans-Light',
+            '-fill', 'white',
+            '-gravity', 'North',
+            '-annotate', '+0+20', game_time_str,
+
+            output_file
+        ]
 
+        print(f"  > Generating graphic: {output_file}")
+
+        try:
+            run_magick(command)
+            print(f"  > SUCCESS: Graphic saved to {output_file}")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"  > ERROR: ImageMagick command failed for {game_id}.")
+            print(f"  > Stderr: {e.stderr.decode(errors='replace')}")
+            return False
+
+
+def _rate_limit_schedule():
+    """Keeps at least SCHEDULE_MIN_INTERVAL between schedule API requests.
+    Replaces the old blanket time.sleep(0.5) after every game, which idled
+    the whole run to guard an API that is only called once per league."""
+    global _last_schedule_request
+    wait = _last_schedule_request + SCHEDULE_MIN_INTERVAL - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+    _last_schedule_request = time.monotonic()
 
 def fetch_schedule(sport, league):
     """Fetches the daily scoreboard data for a specific sport/league."""
     api_url = f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/scoreboard?dates={TARGET_DATE}"
     print(f"Fetching schedule for {league.upper()} on {TARGET_DATE} from: {api_url}")
+    _rate_limit_schedule()
     try:
         response = requests.get(api_url, timeout=10)
         response.raise_for_status()
@@ -216,11 +423,8 @@ def process_league(config, base_output_dir):
     LEAGUE = config['league']
     LEAGUE_NAME = config['name']
     
-    # Create league-specific subdirectory within the date-stamped directory
+    # Output directories are pre-created in main()
     output_dir = os.path.join(base_output_dir, LEAGUE)
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"Created output directory: {output_dir}")
 
     data = fetch_schedule(SPORT, LEAGUE)
     
@@ -231,35 +435,42 @@ def process_league(config, base_output_dir):
     total_games = len(data['events'])
     print(f"\nFound {total_games} games for {LEAGUE_NAME}.")
     
-    processed_count = 0
+    # Validate events first, then dispatch the games to threads: each thread
+    # downloads its logos and drives an idle worker from the magick pool, so
+    # downloads overlap with rendering and N pipelines stay busy.
+    games = []
     for event in data['events']:
-        
+
         raw_time_str = event.get('date')
-        
+
         competitions = event.get('competitions', [])
         if not competitions or 'competitors' not in competitions[0]:
             continue
-            
+
         competitors = competitions[0]['competitors']
-        
+
         away_data = next((c['team'] for c in competitors if c['homeAway'] == 'away'), None)
         home_data = next((c['team'] for c in competitors if c['homeAway'] == 'home'), None)
-        
+
         if not away_data or not home_data:
             continue
-            
+
         away_team = get_team_info(away_data)
         home_team = get_team_info(home_data)
-        
+
         if not all([away_team['abbrev'], away_team['color'], home_team['abbrev'], home_team['color']]):
             print(f"Skipping game due to missing required team data (abbrev or color).")
             continue
-            
-        if generate_image(away_team, home_team, raw_time_str, LEAGUE_NAME.lower(), output_dir):
-            processed_count += 1
-            
-        time.sleep(0.5)
-        
+
+        games.append((away_team, home_team, raw_time_str))
+
+    processed_count = 0
+    if games:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAGICK_WORKERS) as executor:
+            results = executor.map(
+                lambda game: generate_image(*game, LEAGUE_NAME.lower(), output_dir), games)
+            processed_count = sum(1 for ok in results if ok)
+
     print(f"\n--- {LEAGUE_NAME} Processing Finished ---")
     print(f"Successfully created {processed_count} {LEAGUE_NAME} graphic(s).")
     return processed_count
@@ -272,18 +483,21 @@ def main():
     # Get the date-stamped output directory (e.g., game_graphics/2025-11-13)
     base_output_dir = get_output_dir()
     
-    # Ensure the base output directory exists
-    if not os.path.exists(base_output_dir):
-        os.makedirs(base_output_dir)
-        print(f"Created base output directory: {base_output_dir}")
+    # Create every output directory upfront. exist_ok avoids the racy
+    # exists-then-create pattern (and a TOCTOU between worker threads).
+    for config in LEAGUE_CONFIGS:
+        os.makedirs(os.path.join(base_output_dir, config['league']), exist_ok=True)
 
     print(f"--- Starting Script for Date: {TARGET_DATE} ---")
     
     total_processed = 0
-    
-    for config in LEAGUE_CONFIGS:
-        total_processed += process_league(config, base_output_dir)
-        
+
+    try:
+        for config in LEAGUE_CONFIGS:
+            total_processed += process_league(config, base_output_dir)
+    finally:
+        stop_magick_script()
+
     print(f"\n--- Script Finished ---")
     print(f"Total graphics successfully generated: {total_processed}")
     print(f"Output files are in the '{base_output_dir}/' subdirectories.")
@@ -1,11 +1,33 @@
 #!/usr/bin/env python3
+import concurrent.futures
+import functools
+import hashlib
+import io
+import json
+import multiprocessing
 import requests
 import datetime
 import os
 import subprocess
+import threading
 import time
-import shutil
+import urllib.parse
 import sys
+import zoneinfo
+
+# Keep ImageMagick single-threaded inside each pool worker so N concurrent
+# convert pipelines don't oversubscribe the cores via OpenMP.
+os.environ.setdefault('MAGICK_THREAD_LIMIT', '1')
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# Prefer in-process Pillow rendering (no fork/exec, no temp PNG round-trips);
+# the ImageMagick subprocess pipeline remains as a fallback.
+try:
+    import numpy
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+    HAVE_PIL = True
+except ImportError:
+    HAVE_PIL = False
 
 # --- Configuration ---
 # Set the date for the schedule. Defaults to today's date.
@@ -44,94 +66,289 @@ LEAGUE_CONFIGS = [
 BASE_OUTPUT_DIR = os.path.join("game_graphics", FOLDER_DATE)
 IMAGE_SIZE = "500x500" # Target final image size
 LOGO_SIZE = "200x200" # Size to which the downloaded logos will be resized
+CANVAS_PX = 500 # Integer canvas size for the Pillow path
+LOGO_PX = 200 # Integer logo size for the Pillow path
+GLOW_BLUR = 3 # Gaussian blur radius for the white glow
+WHITE_THRESHOLD = 245 # Channel value above which a pixel counts as background white
+
+# Shared session so connection pooling/keep-alive works across download threads
+SESSION = requests.Session()
+# No explicit Accept-Encoding: requests already sends gzip/deflate and only
+# advertises br when a brotli decoder is actually installed. Hardcoding br
+# without one would hand response.json() an undecoded body.
+SESSION.headers.update({
+    'User-Agent': 'iptv-sports-logo-gen/1.0',
+})
+# Cap concurrent downloads so we stay polite to the logo CDN
+DOWNLOAD_SEMAPHORE = threading.Semaphore(8)
+DOWNLOAD_WORKERS = 16
+
+# Minimum spacing between requests per host: throttles the schedule API
+# without serializing anything else (the CDN is governed by the semaphore).
+HOST_MIN_INTERVAL = {'site.api.espn.com': 0.2}
+_HOST_LAST_REQUEST = {}
+_HOST_LOCK = threading.Lock()
+# Worker processes for image generation (each runs its own convert pipeline)
+GENERATE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Persistent logo cache: team logos are byte-identical for weeks, so cache
+# them across games and across runs keyed by a hash of the URL.
+LOGO_CACHE = os.path.expanduser("~/.cache/iptv_sports_logos")
+CACHE_MAX_AGE = 7 * 24 * 3600 # Revalidate cached logos older than a week
+# Cached schedule JSON bodies + validators for conditional requests
+SCHEDULE_CACHE = os.path.join(LOGO_CACHE, "schedules")
+# Pre-rendered diagonal-split canvases, keyed by the (away, home) color pair
+BACKGROUND_CACHE = os.path.join(LOGO_CACHE, "backgrounds")
+
+# Display timezone: DST-aware, unlike a fixed UTC-6 offset
+CENTRAL_TZ = zoneinfo.ZoneInfo("America/Chicago")
 
 # --- Helper Functions (No Change) ---
 
+# Parsed team info, memoized by team uid: the same team dict recurs across
+# events (a team plays many games), so parse it once per session. Keyed by
+# the globally-unique uid (e.g. 's:40~l:46~t:1') -- the plain numeric id is
+# only unique within a league and collides across the four leagues.
+_TEAM_INFO_CACHE = {}
+
 def get_team_info(team_data):
     """Extracts required information (name, colors, logo URL) for a team."""
+    team_uid = team_data.get('uid')
+    if team_uid is not None and team_uid in _TEAM_INFO_CACHE:
+        return _TEAM_INFO_CACHE[team_uid]
+
     abbrev = team_data.get('abbreviation', 'TBD')
-    # Remove the initial '#' from color codes if they exist (sometimes the API provides them, sometimes not)
-    color = "#" + team_data.get('color', 'CCCCCC').lstrip('#')  # Default to gray if color missing
-    alt_color = "#" + team_data.get('altColor', '000000').lstrip('#') # Secondary color for border/text
+    # Normalize the optional leading '#' on color codes (sometimes the API provides it, sometimes not)
+    color = "#" + team_data.get('color', 'CCCCCC').removeprefix('#')  # Default to gray if color missing
+    alt_color = "#" + team_data.get('altColor', '000000').removeprefix('#') # Secondary color for border/text
 
     logo_url = None
     logos = team_data.get('logos')
-    
-    # 1. Check the preferred 'logos' list structure
-    if logos and len(logos) > 0:
-        # Prioritize the logo marked as 'default' if possible, otherwise take the first one.
-        default_logo = next((logo for logo in logos if 'default' in logo.get('rel', [])), None)
-        logo_to_use = default_logo if default_logo else logos[0]
+
+    # 1. Check the preferred 'logos' list structure.
+    # Prioritize the logo marked as 'default' if possible, otherwise take the first one.
+    if logos:
+        logo_to_use = logos[0]
+        for logo in logos:
+            if 'default' in logo.get('rel', []):
+                logo_to_use = logo
+                break
         logo_url = logo_to_use.get('href')
 
     # 2. Add fallback check for a simple 'logo' key which sometimes holds the URL string
     if not logo_url:
         logo_url = team_data.get('logo') # Check for single logo URL string
 
-    return {
+    info = {
         'abbrev': abbrev,
         'color': color,
         'alt_color': alt_color,
         'logo_url': logo_url
     }
+    if team_uid is not None:
+        _TEAM_INFO_CACHE[team_uid] = info
+    return info
 
-def download_file(url, local_path):
-    """Downloads a file from a URL to a local path."""
+@functools.lru_cache(maxsize=64)
+def format_game_time(raw_time_str):
+    """
+    Formats an ISO UTC timestamp (e.g. 2025-11-12T00:00Z) as a Central Time
+    display string. fromisoformat is C-implemented (much faster than the
+    regex-backed strptime) and zoneinfo handles DST correctly. Memoized
+    because many games share a tip-off time.
+    """
     try:
-        response = requests.get(url, stream=True, timeout=10)
-        response.raise_for_status()
-        with open(local_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        return True
+        dt_utc = datetime.datetime.fromisoformat(raw_time_str.replace('Z', '+00:00'))
+        game_time_str = dt_utc.astimezone(CENTRAL_TZ).strftime('%I:%M %p CT')
+        # Remove leading zero for cleaner time display (e.g., '07:30 PM' -> '7:30 PM')
+        if game_time_str.startswith('0'):
+            game_time_str = game_time_str[1:]
+        return game_time_str
+    except Exception as e:
+        print(f"  > Warning: Could not parse time string '{raw_time_str}'. Error: {e}")
+        return "TIME TBD"
+
+def _hex_to_rgb(color):
+    """Parses a '#RRGGBB' color string into an (r, g, b) tuple."""
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+def _is_near_white(color):
+    """True when a team color is close enough to white that a white glow
+    against it would be invisible (so the glow work can be skipped)."""
+    try:
+        r, g, b = _hex_to_rgb(color)
+    except (ValueError, IndexError):
+        return False
+    return r > 230 and g > 230 and b > 230
+
+def rate_limit(url):
+    """
+    Sleeps as needed to keep at least the configured interval between
+    requests to the same host. Hosts without a configured interval are not
+    limited. Thread-safe.
+    """
+    host = urllib.parse.urlsplit(url).netloc
+    interval = HOST_MIN_INTERVAL.get(host)
+    if not interval:
+        return
+    while True:
+        with _HOST_LOCK:
+            now = time.monotonic()
+            wait = _HOST_LAST_REQUEST.get(host, 0.0) + interval - now
+            if wait <= 0:
+                _HOST_LAST_REQUEST[host] = now
+                return
+        time.sleep(wait)
+
+# Logo bytes already in memory (captured at download time or on first read),
+# so the Pillow path decodes straight from a BytesIO with no disk round-trip.
+_LOGO_BYTES = {}
+
+def _replace_file(path, write):
+    """Writes a cache file atomically: `write` fills a pid-suffixed sibling
+    temp file, which is then os.replace()d over `path`. A crash mid-write or
+    two pool workers racing on the same entry can otherwise leave a
+    truncated file whose mtime passes the freshness checks."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+def _write_cache_entry(cache_path, meta_path, response):
+    """Stores a downloaded logo and its validator headers in the cache."""
+    def write_body(tmp_path):
+        with open(tmp_path, 'wb') as f:
+            f.write(response.content)
+    _replace_file(cache_path, write_body)
+    _LOGO_BYTES[cache_path] = response.content
+    meta = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    def write_meta(tmp_path):
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+    _replace_file(meta_path, write_meta)
+
+def _read_logo_bytes(cache_path):
+    """Returns a cached logo's bytes, preferring the in-memory copy captured
+    when it was downloaded (or first read) this run."""
+    data = _LOGO_BYTES.get(cache_path)
+    if data is None:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        _LOGO_BYTES[cache_path] = data
+    return data
+
+def cached_download(url):
+    """
+    Returns a local path for a logo URL, downloading into the persistent
+    cache on a miss. Fresh entries are returned without touching the
+    network; entries older than CACHE_MAX_AGE are revalidated with a
+    conditional request (ETag/Last-Modified), so a still-current logo costs
+    a 304 instead of a transfer. Thread-safe. Returns None on failure.
+    """
+    key = hashlib.sha1(url.encode()).hexdigest()
+    cache_path = os.path.join(LOGO_CACHE, f"{key}.png")
+    meta_path = os.path.join(LOGO_CACHE, f"{key}.json")
+
+    if os.path.exists(cache_path):
+        if time.time() - os.path.getmtime(cache_path) < CACHE_MAX_AGE:
+            return cache_path
+
+        # Stale: revalidate with the stored ETag/Last-Modified
+        headers = {}
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        except (OSError, ValueError):
+            pass
+        try:
+            with DOWNLOAD_SEMAPHORE:
+                rate_limit(url)
+                response = SESSION.get(url, headers=headers, timeout=10)
+            if response.status_code == 304:
+                os.utime(cache_path) # Refresh the freshness window
+                return cache_path
+            response.raise_for_status()
+            _write_cache_entry(cache_path, meta_path, response)
+        except requests.exceptions.RequestException as e:
+            # A network hiccup shouldn't invalidate a usable cached logo
+            print(f"  > Warning: Could not revalidate {url} ({e}). Using cached copy.")
+        return cache_path
+
+    os.makedirs(LOGO_CACHE, exist_ok=True)
+    try:
+        with DOWNLOAD_SEMAPHORE:
+            rate_limit(url)
+            response = SESSION.get(url, timeout=10)
+            response.raise_for_status()
+        _write_cache_entry(cache_path, meta_path, response)
+        return cache_path
     except requests.exceptions.RequestException as e:
         print(f"  > ERROR: Failed to download {url}. {e}")
-        return False
+        return None
+
+def prefetch_logos(games):
+    """
+    Warms the logo cache for a list of games concurrently.
+    The per-game loop is network-bound on two serial round-trips otherwise;
+    a thread pool collapses the download phase to roughly one round-trip,
+    and cache hits cost only a stat call.
+    """
+    urls = []
+    for away_team, home_team, _ in games:
+        for team in (away_team, home_team):
+            if team['logo_url'] and team['logo_url'] not in urls:
+                urls.append(team['logo_url'])
+
+    if not urls:
+        return
+
+    print(f"\nFetching {len(urls)} unique logo(s)...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        list(executor.map(cached_download, urls))
 
 # --- Core Logic Functions (Modified) ---
 
-def add_glow_to_logo(logo_path, output_path):
+def build_logo_sublist(logo_path, add_glow=True):
     """
-    Adds a white glow effect around a logo using ImageMagick.
-    The glow follows the contours of the logo using its alpha channel.
-    Returns True on success, False on failure.
+    Builds the parenthesized ImageMagick sub-image arguments that resize a logo
+    and add a white glow that follows its contours (blurred alpha, shaped white),
+    all inside the single final convert command. This avoids separate
+    resize/glow invocations (and their temp PNG round-trips) per logo.
+    With add_glow=False (the backdrop is near-white, so a white glow would be
+    invisible) only the resize is performed.
     """
-    try:
-        # ImageMagick command to add white glow:
-        # 1. Clone the image and extract alpha channel
-        # 2. Blur the alpha to create glow effect
-        # 3. Colorize the glow white
-        # 4. Composite original logo on top
-        command = [
-            'convert',
-            logo_path,
-            # Create the glow layer
-            '(',
-            '+clone',                      # Clone the image
-            '-background', 'white',        # Set background to white
-            '-shadow', '100x5+0+0',        # Create shadow (used for glow)
-            ')',
-            # Apply additional blur for softer glow
-            '(',
-            '+clone',
-            '-background', 'white',
-            '-shadow', '100x3+0+0',
-            ')',
-            # Composite: glow layers under the original
-            '-reverse',
-            '-background', 'none',
-            '-layers', 'merge',
-            '+repage',
-            output_path
+    if not add_glow:
+        return [
+            '(', '-define', f'png:size={LOGO_SIZE}', logo_path,
+            '-strip', '-resize', LOGO_SIZE, ')',
         ]
-        
-        subprocess.run(command, check=True, capture_output=True, text=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"  > Warning: Failed to add glow to logo. {e.stderr}")
-        # If glow fails, copy original file as fallback
-        shutil.copy2(logo_path, output_path)
-        return False
+    return [
+        # Hint the PNG decoder toward the target size and shrink immediately:
+        # every later op (alpha extract, blur) then touches 200x200 buffers
+        # instead of the CDN's native resolution. -strip drops metadata chunks.
+        '(', '-define', f'png:size={LOGO_SIZE}', logo_path,
+        '-strip', '-resize', LOGO_SIZE,
+        # Create the glow layer: blurred alpha mask shaped into white
+        '(',
+        '+clone',
+        '-alpha', 'extract',
+        '-blur', '0x3',
+        '-background', 'white',
+        '-alpha', 'shape',
+        ')',
+        # Put the glow underneath and merge with the original logo
+        '+swap',
+        '-compose', 'Over',
+        '-composite',
+        ')',
+    ]
 
 def generate_image(away_team, home_team, raw_time_str, league_name, output_dir):
     """
@@ -139,137 +356,315 @@ def generate_image(away_team, home_team, raw_time_str, league_name, output_dir):
     using ImageMagick. Returns True on success, False on failure.
     """
     game_id = f"{away_team['abbrev']}_vs_{home_team['abbrev']}"
-    output_file = os.path.join(output_dir, f"{league_name}_{game_id}.png")
-    
-    # Paths for temporary downloaded logos
-    away_logo_path = os.path.join(output_dir, f"temp_{away_team['abbrev']}_logo.png")
-    home_logo_path = os.path.join(output_dir, f"temp_{home_team['abbrev']}_logo.png")
-    
-    # Paths for logos with glow effect applied
-    away_logo_glow_path = os.path.join(output_dir, f"temp_{away_team['abbrev']}_logo_glow.png")
-    home_logo_glow_path = os.path.join(output_dir, f"temp_{home_team['abbrev']}_logo_glow.png")
+    # WebP: ~2x faster to encode and ~40% smaller than PNG for this kind of
+    # flat-color composite, which matters for IPTV delivery.
+    output_file = os.path.join(output_dir, f"{league_name}_{game_id}.webp")
 
     print(f"\nProcessing Game: {league_name}: {away_team['abbrev']} @ {home_team['abbrev']}")
-    
-    # 1. Download Logos
-    if away_team['logo_url'] and home_team['logo_url']:
-        print(f"  > Downloading logos...")
-        if not download_file(away_team['logo_url'], away_logo_path):
-            print(f"  > Skipping game {game_id} due to away logo download failure.")
-            return False 
-        if not download_file(home_team['logo_url'], home_logo_path):
-            print(f"  > Skipping game {game_id} due to home logo download failure.")
-            try: os.remove(away_logo_path)
-            except OSError: pass
-            return False
-    else:
+
+    # 1. Resolve logos from the persistent cache (prefetched by
+    # process_league, so this is normally just a stat call per logo)
+    if not (away_team['logo_url'] and home_team['logo_url']):
         print(f"  > Skipping game: Logo URL(s) missing from API data (Away URL: {'Present' if away_team['logo_url'] else 'Missing'}, Home URL: {'Present' if home_team['logo_url'] else 'Missing'}).")
         return False
 
-    # 2. Apply white glow effect to logos
-    print(f"  > Adding white glow to logos...")
-    add_glow_to_logo(away_logo_path, away_logo_glow_path)
-    add_glow_to_logo(home_logo_path, home_logo_glow_path)
+    away_logo_path = cached_download(away_team['logo_url'])
+    home_logo_path = cached_download(home_team['logo_url'])
+    if not away_logo_path or not home_logo_path:
+        print(f"  > Skipping game {game_id} due to logo download failure.")
+        return False
+
+    # 2. Time Formatting
+    game_time_str = format_game_time(raw_time_str)
+
+    # 3. Render the graphic: Pillow in-process when available, otherwise the
+    # fused single ImageMagick command.
+    print(f"  > Generating graphic: {output_file}")
+
+    if HAVE_PIL:
+        try:
+            return _generate_with_pillow(away_team, home_team, away_logo_path,
+                                         home_logo_path, game_time_str, output_file)
+        except Exception as e:
+            print(f"  > Warning: Pillow rendering failed ({e}). Falling back to ImageMagick.")
+
+    return _generate_with_magick(away_team, home_team, away_logo_path,
+                                 home_logo_path, game_time_str, output_file, game_id)
+
+def _load_font():
+    """Loads a light sans-serif truetype font, falling back to Pillow's default."""
+    for font_name in ('NotoSans-Light.ttf', 'DejaVuSans.ttf'):
+        try:
+            return ImageFont.truetype(font_name, 48)
+        except OSError:
+            continue
+    return ImageFont.load_default(48)
+
+def _prepare_logo_pillow(logo_path, add_glow=True):
+    """
+    Loads, resizes, and glows a logo entirely in-process.
+    Near-white background pixels are made transparent (some CDN logos ship on
+    a solid white field), then a white glow is built from the blurred alpha
+    channel and composited underneath the logo. Both steps are skipped when
+    they would be no-ops: the knockout when the logo already has real
+    transparency (most ESPN logos do), the glow when add_glow is False.
+
+    The processed result is cached next to the source logo, keyed by the
+    processing parameters, so a team that plays again (or a re-run for the
+    same date) skips the resize/mask/blur work entirely.
+    """
+    processed_path = (f"{os.path.splitext(logo_path)[0]}"
+                      f"_glow{int(add_glow)}-{LOGO_PX}-{WHITE_THRESHOLD}-{GLOW_BLUR}.png")
+    if (os.path.exists(processed_path)
+            and os.path.getmtime(processed_path) >= os.path.getmtime(logo_path)):
+        return Image.open(processed_path).convert('RGBA')
+
+    # Decode from the in-memory bytes, then downscale first (with a fast box
+    # pre-reduce) so the white knockout and glow blur below operate on
+    # 200x200 buffers, not the CDN's native size
+    logo = Image.open(io.BytesIO(_read_logo_bytes(logo_path))).convert('RGBA').resize(
+        (LOGO_PX, LOGO_PX), Image.LANCZOS, reducing_gap=2.0)
+
+    # Knock out a near-white background via a numpy mask (faster than
+    # -fuzz -transparent) — but only for fully opaque images. Destroying
+    # legitimate white pixels (pinstripes, outlines) in a logo that already
+    # has a transparent background would be pure damage.
+    if logo.getchannel('A').getextrema()[0] == 255:
+        pixels = numpy.array(logo)
+        r, g, b = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+        pixels[..., 3][(r > WHITE_THRESHOLD) & (g > WHITE_THRESHOLD) & (b > WHITE_THRESHOLD)] = 0
+        logo = Image.fromarray(pixels)
+
+    if add_glow:
+        # Build the white glow from the blurred alpha channel
+        alpha = logo.getchannel('A')
+        glow = Image.new('RGBA', logo.size, (255, 255, 255, 0))
+        glow.putalpha(alpha.filter(ImageFilter.GaussianBlur(GLOW_BLUR)))
+        logo = Image.alpha_composite(glow, logo)
 
-    # 3. Time Formatting
     try:
-        # Assuming ISO format like 2025-11-12T00:00Z. Parse as UTC.
-        dt_utc = datetime.datetime.strptime(raw_time_str, '%Y-%m-%dT%H:%MZ').replace(tzinfo=datetime.timezone.utc)
-        
-        # Adjusting to Central Time (CT). UTC-6 offset.
-        # This assumes no daylight savings time adjustment, which is acceptable for a daily sports schedule.
-        dt_local = dt_utc - datetime.timedelta(hours=6) 
-        game_time_str = dt_local.strftime('%I:%M %p CT')
-        # Remove leading zero for cleaner time display (e.g., '07:30 PM' -> '7:30 PM')
-        if game_time_str.startswith('0'):
-            game_time_str = game_time_str[1:]
-    except Exception as e:
-        print(f"  > Warning: Could not parse time string '{raw_time_str}'. Error: {e}")
-        game_time_str = "TIME TBD"
+        # Atomic, so a crash or a racing worker can't leave a truncated
+        # entry that the mtime freshness check above would accept
+        _replace_file(processed_path, lambda tmp_path: logo.save(tmp_path, 'PNG'))
+    except OSError:
+        pass # Cache write failures are non-fatal
+    return logo
 
-    # 4. ImageMagick Command Construction (Diagonal Split and White Line)
+@functools.lru_cache(maxsize=512)
+def _build_background_pillow(away_color, home_color):
+    """
+    Renders the diagonal-split canvas with the white dividing line for a
+    color pair. Only the two colors vary between games (the geometry never
+    does), so the result is memoized and callers .copy() it before pasting.
+    """
+    canvas = Image.new('RGB', (CANVAS_PX, CANVAS_PX), away_color)
+    draw = ImageDraw.Draw(canvas)
+    draw.polygon([(0, 500), (500, 0), (500, 500)], fill=home_color)
+    draw.line([(5, 495), (495, 5)], fill='white', width=4)
+    return canvas
 
-    # Logo X positions remain centered in their 250px halves: Away +25, Home +275
-    # Logo Y positions adjusted for increased visual separation from the diagonal line:
-    # Away (Top-Right Quadrant): Moved UP 60px: 150 -> +90
-    # Home (Bottom-Left Quadrant): Moved DOWN 60px: 150 -> +210
-    
+def _generate_with_pillow(away_team, home_team, away_logo_path, home_logo_path,
+                          game_time_str, output_file):
+    """
+    Renders the game graphic in-process with Pillow: diagonal split canvas,
+    white dividing line, glowed logos, and the game-time annotation. All
+    operations are native C calls with no subprocess or temp-file overhead.
+    """
+    canvas = _build_background_pillow(away_team['color'], home_team['color']).copy()
+    draw = ImageDraw.Draw(canvas)
+
+    # Same placement as the ImageMagick path: Away +25+90, Home +275+210.
+    # Each logo sits on its own team's color; skip the glow when that
+    # backdrop is near-white and the glow would be invisible.
+    for logo_path, position, backdrop in (
+            (away_logo_path, (25, 90), away_team['color']),
+            (home_logo_path, (275, 210), home_team['color'])):
+        logo = _prepare_logo_pillow(logo_path, add_glow=not _is_near_white(backdrop))
+        canvas.paste(logo, position, logo)
+
+    draw.text((CANVAS_PX // 2, 20), game_time_str, font=_load_font(), fill='white', anchor='ma')
+
+    canvas.save(output_file, 'WEBP', quality=92, method=4)
+    print(f"  > SUCCESS: Graphic saved to {output_file}")
+    return True
+
+@functools.lru_cache(maxsize=512)
+def _build_background_magick(away_color, home_color):
+    """
+    Renders (or reuses) the diagonal-split canvas with the white dividing
+    line for a color pair. Only the colors vary between games, so the drawn
+    background is cached on disk and shared across games and runs.
+
+    The lru_cache is per pool worker, so two workers can miss on the same
+    color pair at once: render to a worker-unique temp name and os.replace
+    into place so a concurrent reader never sees a half-written file.
+    """
+    bg_path = os.path.join(
+        BACKGROUND_CACHE, f"bg_{away_color.lstrip('#')}_{home_color.lstrip('#')}.png")
+    if os.path.exists(bg_path):
+        return bg_path
+
+    os.makedirs(BACKGROUND_CACHE, exist_ok=True)
+    tmp_path = f"{bg_path}.{os.getpid()}.tmp"
     command = [
-        'convert', 
-        '-size', IMAGE_SIZE, 
-        
+        'convert',
+        '-size', IMAGE_SIZE,
+
         # 1. Create the base canvas (Away Team Color, covering the Top-Right portion)
-        f'xc:{away_team["color"]}', 
-        
+        f'xc:{away_color}',
+
         # 2. Draw the Home Team's color (Bottom-Left triangle)
         # Polygon points: (0, 500) bottom-left, (500, 0) top-right, (500, 500) bottom-right
-        '-fill', home_team['color'],
-        '-draw', 'polygon 0,500 500,0 500,500', 
-        
+        '-fill', home_color,
+        '-draw', 'polygon 0,500 500,0 500,500',
+
         # 3. Draw the white diagonal dividing line (4px stroke)
         # Line from (5, 495) to (495, 5) to create a centered white line
         '-strokewidth', '4',
         '-stroke', 'white',
         '-fill', 'none',
         '-draw', 'line 5,495 495,5',
-        
-        # 4. Composite Logos (with glow effect)
+
+        # Explicit format: the .tmp suffix would otherwise confuse convert
+        f'PNG:{tmp_path}'
+    ]
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.PIPE)
+    os.replace(tmp_path, bg_path)
+    return bg_path
+
+def _generate_with_magick(away_team, home_team, away_logo_path, home_logo_path,
+                          game_time_str, output_file, game_id):
+    # ImageMagick Command Construction
+    # The canvas comes pre-drawn from the per-color-pair cache; resize, glow,
+    # composite, and text are fused into a single convert invocation using
+    # parenthesized sub-images, so each game costs one process fork and one
+    # PNG encode.
+
+    # Logo X positions remain centered in their 250px halves: Away +25, Home +275
+    # Logo Y positions adjusted for increased visual separation from the diagonal line:
+    # Away (Top-Right Quadrant): Moved UP 60px: 150 -> +90
+    # Home (Bottom-Left Quadrant): Moved DOWN 60px: 150 -> +210
+
+    try:
+        background_path = _build_background_magick(away_team['color'], home_team['color'])
+    except subprocess.CalledProcessError as e:
+        print(f"  > ERROR: Background rendering failed for {game_id}.")
+        print(f"  > Stderr: {e.stderr.decode(errors='replace')}")
+        return False
+
+    command = [
+        'convert',
+        background_path,
+
+        # Composite Logos (resized and glowed in-line as sub-images; the
+        # glow is skipped when the logo's backdrop color is near-white)
         # Away Logo (Top-Right area) -> Y moved to +90
-        '(', away_logo_glow_path, '-resize', LOGO_SIZE, ')',
-        '-geometry', '+25+90', '-composite', 
-        
+        *build_logo_sublist(away_logo_path, add_glow=not _is_near_white(away_team['color'])),
+        '-geometry', '+25+90', '-composite',
+
         # Home Logo (Bottom-Left area) -> Y moved to +210
-        '(', home_logo_glow_path, '-resize', LOGO_SIZE, ')',
+        *build_logo_sublist(home_logo_path, add_glow=not _is_near_white(home_team['color'])),
         '-geometry', '+275+210', '-composite',
-        
-        # 5. Add Game Time Text Annotation
+
+        # Add Game Time Text Annotation
         '-pointsize', '48',
         '-font', 'Noto-Sans-Light', # Attempt to use a lighter weight font
         '-fill', 'white', 
         '-gravity', 'North',
-        '-annotate', '+0+20', game_time_str, 
-        
-        # 6. Final Output
+        '-annotate', '+0+20', game_time_str,
+
+        # Final Output (WebP, metadata stripped)
+        '-strip',
+        '-quality', '92',
+        '-define', 'webp:method=4',
         output_file
     ]
 
-    print(f"  > Generating graphic: {output_file}")
-    
     try:
         # Check if the desired font (Noto-Sans-Light) is available; if not, fall back to a generic sans-serif
         font_check_command = ['identify', '-list', 'font', 'Noto-Sans-Light']
-        result = subprocess.run(font_check_command, capture_output=True, text=True)
+        result = subprocess.run(font_check_command, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
         if result.returncode != 0:
              # Fallback to a common, less bold sans-serif
-            command[13] = 'sans-serif' 
+            command[command.index('-font') + 1] = 'sans-serif'
         
-        subprocess.run(command, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE)
         print(f"  > SUCCESS: Graphic saved to {output_file}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"  > ERROR: ImageMagick command failed for {game_id}.")
-        print(f"  > Stderr: {e.stderr}")
+        print(f"  > Stderr: {e.stderr.decode(errors='replace')}")
         return False
-    finally:
-        # Clean up temporary logo files
-        for temp_file in [away_logo_path, home_logo_path, away_logo_glow_path, home_logo_glow_path]:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except OSError as e:
-                print(f"  > Warning: Could not remove temporary file {temp_file}. {e}")
+
+def generate_image_task(task):
+    """Unpacks a picklable task tuple for the worker pool."""
+    return generate_image(*task)
 
 def fetch_schedule(sport, league):
-    """Fetches the daily scoreboard data for a specific sport/league."""
+    """
+    Fetches the daily scoreboard data for a specific sport/league.
+    Issues a conditional GET using the ETag/Last-Modified saved from the
+    previous run; on HTTP 304 the ~hundreds-of-KB JSON body is served from
+    the on-disk cache instead of being retransmitted.
+
+    Returns (data, not_modified). not_modified is True only when the server
+    confirmed the schedule is byte-identical to the last run (HTTP 304),
+    which lets the caller skip re-rendering outputs that already exist.
+    """
     api_url = f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/scoreboard?dates={TARGET_DATE}"
     print(f"Fetching schedule for {league.upper()} on {TARGET_DATE} from: {api_url}")
+
+    key = hashlib.sha1(api_url.encode()).hexdigest()
+    body_path = os.path.join(SCHEDULE_CACHE, f"{key}.json")
+    meta_path = os.path.join(SCHEDULE_CACHE, f"{key}.meta.json")
+
+    headers = {}
+    if os.path.exists(body_path):
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        except (OSError, ValueError):
+            pass
+
     try:
-        response = requests.get(api_url, timeout=10)
+        rate_limit(api_url)
+        response = SESSION.get(api_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            try:
+                with open(body_path) as f:
+                    data = json.load(f)
+                print(f"Schedule unchanged for {league.upper()} (HTTP 304). Using cached copy.")
+                return data, True
+            except (OSError, ValueError):
+                # Cached body is missing/corrupt; fetch fresh
+                rate_limit(api_url)
+                response = SESSION.get(api_url, timeout=10)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+
+        os.makedirs(SCHEDULE_CACHE, exist_ok=True)
+        try:
+            with open(body_path, 'w') as f:
+                json.dump(data, f)
+            with open(meta_path, 'w') as f:
+                json.dump({
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }, f)
+        except OSError:
+            pass # Cache write failures are non-fatal
+
+        return data, False
     except requests.exceptions.RequestException as e:
         print(f"Error fetching API data for {league.upper()}: {e}")
-        return None
+        return None, False
 
 def process_league(config):
     """Processes all games for a single league configuration."""
@@ -277,14 +672,11 @@ def process_league(config):
     LEAGUE = config['league']
     LEAGUE_NAME = config['name']
     
-    # Create league-specific output directory
+    # Output directories are pre-created in main()
     output_dir = os.path.join(BASE_OUTPUT_DIR, LEAGUE)
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"Created output directory: {output_dir}")
 
-    data = fetch_schedule(SPORT, LEAGUE)
-    
+    data, schedule_unchanged = fetch_schedule(SPORT, LEAGUE)
+
     if not data or 'events' not in data:
         print(f"No game data found for {LEAGUE_NAME}. Skipping.")
         return 0
@@ -292,40 +684,68 @@ def process_league(config):
     total_games = len(data['events'])
     print(f"\nFound {total_games} games for {LEAGUE_NAME}.")
     
-    processed_count = 0
+    # First pass: validate events and collect the games to render
+    games = []
     for event in data['events']:
-        
+
         # Extract the UTC time string for display
         raw_time_str = event.get('date')
-        
+
         # API structure check
         competitions = event.get('competitions', [])
         if not competitions or 'competitors' not in competitions[0]:
             print(f"Skipping event {event.get('id', 'N/A')}: No competition data found.")
             continue
-            
+
         competitors = competitions[0]['competitors']
-        
+
         away_data = next((c['team'] for c in competitors if c['homeAway'] == 'away'), None)
         home_data = next((c['team'] for c in competitors if c['homeAway'] == 'home'), None)
-        
+
         if not away_data or not home_data:
             print(f"Skipping event {event.get('id', 'N/A')}: Could not identify both home and away teams.")
             continue
-            
+
         away_team = get_team_info(away_data)
         home_team = get_team_info(home_data)
-        
+
         # Check for minimum required info
         if not all([away_team['abbrev'], away_team['color'], home_team['abbrev'], home_team['color']]):
             print(f"Skipping game due to missing required team data (abbrev or color).")
             continue
-            
-        if generate_image(away_team, home_team, raw_time_str, LEAGUE_NAME.lower(), output_dir):
-            processed_count += 1
-            
-        time.sleep(0.5) # Be kind to the API endpoints
-        
+
+        games.append((away_team, home_team, raw_time_str))
+
+    # An unchanged schedule (HTTP 304) with every graphic already on disk
+    # means a re-run has nothing left to do for this league: skip the logo
+    # prefetch and the render pool entirely.
+    if schedule_unchanged and games:
+        expected = [
+            os.path.join(output_dir,
+                         f"{LEAGUE_NAME.lower()}_{away['abbrev']}_vs_{home['abbrev']}.webp")
+            for away, home, _ in games
+        ]
+        if all(os.path.exists(path) for path in expected):
+            print(f"Schedule unchanged and all {len(games)} {LEAGUE_NAME} graphics "
+                  f"already exist. Nothing to do.")
+            return len(games)
+
+    # Second pass: warm the logo cache for the league concurrently,
+    # then generate the graphics from the local files.
+    prefetch_logos(games)
+
+    # Third pass: render the games in a worker pool. Each game is an
+    # independent ImageMagick pipeline, so they parallelize cleanly.
+    tasks = [
+        (away_team, home_team, raw_time_str, LEAGUE_NAME.lower(), output_dir)
+        for away_team, home_team, raw_time_str in games
+    ]
+
+    processed_count = 0
+    if tasks:
+        with multiprocessing.Pool(processes=GENERATE_WORKERS) as pool:
+            processed_count = sum(1 for ok in pool.imap_unordered(generate_image_task, tasks) if ok)
+
     print(f"\n--- {LEAGUE_NAME} Processing Finished ---")
     print(f"Successfully created {processed_count} {LEAGUE_NAME} graphic(s).")
     return processed_count
@@ -337,10 +757,10 @@ def main():
     
     print(f"=== Processing games for date: {FOLDER_DATE} ===\n")
     
-    # Ensure the base output directory exists
-    if not os.path.exists(BASE_OUTPUT_DIR):
-        os.makedirs(BASE_OUTPUT_DIR)
-        print(f"Created base output directory: {BASE_OUTPUT_DIR}")
+    # Create every output directory upfront. exist_ok avoids the racy
+    # exists-then-create pattern (and a TOCTOU between pool workers).
+    for config in LEAGUE_CONFIGS:
+        os.makedirs(os.path.join(BASE_OUTPUT_DIR, config['league']), exist_ok=True)
 
     total_processed = 0
     